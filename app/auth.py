@@ -2,11 +2,113 @@ from fastapi import Header, HTTPException
 from fastapi import Request
 from http import HTTPStatus
 from app.schemas import GenericResponse, Trace, ErrorCode
+from opentelemetry.trace import get_current_span
 from app.tracing import tracer
 from app.config import SETTINGS
 import jwt
+from jwt.algorithms import get_default_algorithms
+import hashlib
+import sys
+import time
+from collections import OrderedDict
+from types import MappingProxyType
 from fastapi import Depends
 
+# Verified JWT payloads keyed by sha256(token); values are (expires_at, payload).
+# Kept short-lived so a revoked token stops working within a few seconds.
+JWT_CACHE_TTL_SECONDS = 5
+JWT_CACHE_MAX_SIZE = 10000
+BEARER_PREFIX = "Bearer "
+
+# Resolve the algorithm and prepare the verification key once instead of on
+# every jwt.decode call. Only the signature, exp and sub matter to this
+# service, so the remaining registered claim checks are skipped.
+_JWT_ALGORITHMS = [SETTINGS.JWT_ALGORITHM]
+_jwt_algorithm = get_default_algorithms().get(SETTINGS.JWT_ALGORITHM)
+_JWT_KEY = (
+    _jwt_algorithm.prepare_key(SETTINGS.JWT_SECRET_KEY)
+    if _jwt_algorithm is not None
+    else SETTINGS.JWT_SECRET_KEY
+)
+_EXPECTED_SUB = sys.intern(SETTINGS.SERVICE_ID)
+_jwt_decoder = jwt.PyJWT(options={
+    "verify_signature": True,
+    "verify_exp": True,
+    "verify_nbf": False,
+    "verify_iat": False,
+    "verify_aud": False,
+    "verify_iss": False,
+    "require": ["exp", "sub"],
+})
+_jwt_cache: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+
+# The auth failure payload never changes, so serialize it once at import.
+# It is read-only; each exception gets its own shallow copy.
+_AUTH_ERROR_DETAIL = MappingProxyType(GenericResponse.get_error_response(
+    error_code=ErrorCode.ERROR_CODE_AUTH_ERROR,
+    customer_message='Invalid Token'
+).model_dump())
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=HTTPStatus.UNAUTHORIZED,
+        detail=dict(_AUTH_ERROR_DETAIL),
+    )
+
+
+def _auth_failure(request: Request, authorization: str) -> HTTPException:
+    """
+    Record the failed auth attempt and return the exception to raise.
+    Attributes go on the current request span when there is one; otherwise
+    a span is emitted for the failure only. Successful requests add no span
+    data, and the token is only ever recorded as a hash.
+    """
+    # Never read the body here: this dependency runs before the route handler
+    # and awaiting request.body() would buffer the whole upload just to trace it.
+    headers = request.headers
+    attributes = {
+        'auth.failed': True,
+        'token_sha256': hashlib.sha256((authorization or '').encode()).hexdigest(),
+        'content_length': headers.get('content-length', ''),
+        'content_type': headers.get('content-type', ''),
+        'request_id': headers.get('x-request-id', ''),
+        'device_id': headers.get('x-device-id', ''),
+    }
+    span = get_current_span()
+    if span.is_recording():
+        span.set_attributes(attributes)
+    else:
+        with tracer.start_as_current_span("get_request_param", attributes=attributes):
+            pass
+    return _credentials_exception()
+
+
+def _get_cached_payload(key: bytes) -> dict | None:
+    entry = _jwt_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, payload = entry
+    if expires_at <= time.monotonic():
+        del _jwt_cache[key]
+        return None
+    _jwt_cache.move_to_end(key)
+    return payload
+
+
+def _cache_payload(key: bytes, payload: dict) -> None:
+    ttl = float(JWT_CACHE_TTL_SECONDS)
+    exp = payload.get("exp")
+    if exp is not None:
+        ttl = min(ttl, exp - time.time())
+    if ttl <= 0:
+        return
+    _jwt_cache[key] = (time.monotonic() + ttl, payload)
+    _jwt_cache.move_to_end(key)
+    while len(_jwt_cache) > JWT_CACHE_MAX_SIZE:
+        _jwt_cache.popitem(last=False)
+
+
 async def get_trace(
     x_request_id: str = Header(),
     x_device_id: str = Header()
@@ -20,42 +122,21 @@ async def get_trace(
 
 async def get_current_user(
     request: Request, 
-    x_request_id: str | None = Header(default=None), 
-    x_device_id: str | None = Header(default=None),
     authorization: str = Header(),
     trace: Trace = Depends(get_trace)
 ):
-    body = await request.body()
-    body_str = body.decode('utf-8')
-    headers = request.headers
-    attributes: dict[str, str] = {
-        'body': body_str,
-        'token': str(authorization), 
-        'request_id': headers.get('x-request-id', ''), 
-        'device_id': x_device_id or '',
-    }
-
-    with tracer.start_as_current_span("get_request_param", attributes=attributes) as span:
-        error_response = GenericResponse.get_error_response(
-            error_code=ErrorCode.ERROR_CODE_AUTH_ERROR,
-            customer_message='Invalid Token',
-            debug_info={}
-        )
-        credentials_exception = HTTPException(
-            status_code=HTTPStatus.UNAUTHORIZED,
-            detail=error_response.dict(),  # Convert to dictionary for JSON serialization
-        )
-        if not authorization:
-            raise credentials_exception
-        try:
-            token = authorization.split("Bearer ")[1]
-            payload = jwt.decode(token, SETTINGS.JWT_SECRET_KEY, algorithms=[SETTINGS.JWT_ALGORITHM])
-            username: str = payload.get("sub")
-            if username is None:
-                raise credentials_exception
-            elif username != SETTINGS.SERVICE_ID:
-                raise credentials_exception
-            
-        except Exception:
-            raise credentials_exception
-        return trace
\ No newline at end of file
+    if not authorization or not authorization.startswith(BEARER_PREFIX):
+        raise _auth_failure(request, authorization)
+    token = authorization[len(BEARER_PREFIX):]
+    cache_key = hashlib.sha256(token.encode()).digest()
+    if _get_cached_payload(cache_key) is not None:
+        return trace
+    try:
+        payload = _jwt_decoder.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
+    except jwt.PyJWTError:
+        raise _auth_failure(request, authorization)
+    # sub is a required claim, so a single comparison covers the missing case too
+    if payload.get("sub") != _EXPECTED_SUB:
+        raise _auth_failure(request, authorization)
+    _cache_payload(cache_key, payload)
+    return trace
@@ -27,8 +27,7 @@ async def generate_token(request: TokenRequest):
         if request.service_id != SETTINGS.SERVICE_ID:
             error_response = GenericResponse.get_error_response(
                 error_code=ErrorCode.ERROR_CODE_AUTH_ERROR,
-                customer_message='Invalid service_id',
-                debug_info={}
+                customer_message='Invalid service_id'
             )
             raise HTTPException(
                 status_code=HTTPStatus.UNAUTHORIZED,
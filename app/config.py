@@ -1,4 +1,4 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
 from enum import Enum
 from pydantic import validator
@@ -8,14 +8,14 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = ""
     SERVICE_ID: str = ""
 
-    class Config:
-        env_prefix = 'API_'
+    model_config = SettingsConfigDict(env_prefix='API_')
 
 
 class FileUploadSettings(BaseSettings):
     bucket: str = ""
     access_key: str = ""
     key_id: str = ""
+    max_concurrency: int = 16
     
     @validator('access_key', 'key_id')
     def validate_s3_credentials(cls, value, values):
@@ -23,8 +23,7 @@ class FileUploadSettings(BaseSettings):
             raise ValueError(f"'access_key' and 'key_id' cannot be None")
         return value
 
-    class Config:
-        env_prefix = 'FILE_UPLOAD_'
+    model_config = SettingsConfigDict(env_prefix='FILE_UPLOAD_')
 
 
 @lru_cache()
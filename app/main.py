@@ -1,10 +1,20 @@
 # app/main.py
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from app.routers import router
+from fastapi.responses import ORJSONResponse
+from app.routers import router, s3_service
 from app.auth_api import auth_router
 
-app = FastAPI(title="FastAPI AWS S3 Service")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Keep one pooled S3 client and HTTP session open for the lifetime of the worker.
+    await s3_service.open()
+    yield
+    await s3_service.close()
+
+# orjson serializes the URL-heavy upload responses much faster than json.dumps
+app = FastAPI(title="FastAPI AWS S3 Service", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Include S3 routes at the `/s3` prefix.
 app.include_router(router, prefix="/s3", tags=["S3 File Service"])
@@ -1,7 +1,7 @@
 # app/routers/s3_routes.py
 
-import os
 import logging
+from functools import lru_cache
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends
 from app.service import S3FileService
 from app.schemas import (
@@ -12,16 +12,21 @@ from app.schemas import (
     S3UploadFileBytesRequest
 )
 from app.auth import get_current_user, Trace
+from app.config import FILE_UPLOAD_SETTINGS
 
 router = APIRouter()
 
-# Read configuration from environment variables
-S3_BUCKET_NAME = os.getenv("FILE_UPLOAD_BUCKET", "")
-AWS_ACCESS_KEY_ID = os.getenv("FILE_UPLOAD_KEY_ID", "")
-AWS_SECRET_ACCESS_KEY = os.getenv("FILE_UPLOAD_ACCESS_KEY", "")
+@lru_cache()
+def get_s3_service() -> S3FileService:
+    return S3FileService(
+        FILE_UPLOAD_SETTINGS.bucket,
+        FILE_UPLOAD_SETTINGS.key_id,
+        FILE_UPLOAD_SETTINGS.access_key,
+        max_concurrency=FILE_UPLOAD_SETTINGS.max_concurrency
+    )
 
 # Initialize the S3FileService instance.
-s3_service = S3FileService(S3_BUCKET_NAME, AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY)
+s3_service = get_s3_service()
 
 @router.post("/upload/oaas/folder", response_model=S3UploadResponse)
 async def upload_oaas_folder(
@@ -1,11 +1,13 @@
 from enum import Enum
-from typing import Optional, List, Dict, Any, Union
-from pydantic import BaseModel
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Union
+from pydantic import BaseModel, Base64Bytes, ConfigDict
 from datetime import date
 from typing import Optional
 from pydantic.networks import HttpUrl
 from humps import camelize
-from typing import Any, Self
+from typing import Self
+from functools import lru_cache
 
 class InboundDocumentType(str, Enum):
     PDF = "application/pdf"
@@ -48,16 +50,21 @@ class OaasFileRequest(BaseModel):
 
 class ImageBytes(BaseModel):
     """
-    Model for image data with binary content
+    Model for image data with binary content.
+    image_bytes is sent as base64 and decoded once during validation.
     """
+    model_config = ConfigDict(frozen=True, extra='ignore', populate_by_name=True)
+
     image_name: str
     image_type: InboundDocumentType
-    image_bytes: str
+    image_bytes: Base64Bytes
 
 class ProductBytes(BaseModel):
     """
     Model for product with binary image data
     """
+    model_config = ConfigDict(frozen=True, extra='ignore', populate_by_name=True)
+
     product_code: str
     images: list[ImageBytes]
 
@@ -65,6 +72,8 @@ class S3UploadFileBytesRequest(BaseModel):
     """
     Request model for uploading binary product files
     """
+    model_config = ConfigDict(frozen=True, extra='ignore', populate_by_name=True)
+
     user: User
     products: list[ProductBytes]
     tenant: str = 'placeorder'
@@ -78,26 +87,32 @@ class S3UploadResponse(BaseModel):
     Response model for S3 upload endpoints
     """
     s3_urls: dict[str, list[str]]
-    
-    class Config:
-        schema_extra = {
-            "example": {
-                "s3_urls": {
-                    "product_code": [
-                        "https://bucket-name.s3.region.amazonaws.com/path/to/file1.jpg",
-                        "https://bucket-name.s3.region.amazonaws.com/path/to/file2.jpg"
-                    ]
-                }
+
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "s3_urls": {
+                "product_code": [
+                    "https://bucket-name.s3.region.amazonaws.com/path/to/file1.jpg",
+                    "https://bucket-name.s3.region.amazonaws.com/path/to/file2.jpg"
+                ]
             }
         }
+    })
+
+# Aliases for the known CamelModel fields; anything else falls back to humps.
+_CAMEL_ALIASES = {
+    "error_code": "errorCode",
+    "customer_message": "customerMessage",
+    "debug_info": "debugInfo",
+    "request_id": "requestId",
+    "device_id": "deviceId",
+}
 
 def to_camel(string):
-    return camelize(string)
+    return _CAMEL_ALIASES.get(string) or camelize(string)
 
 class CamelModel(BaseModel):
-    class Config:
-        alias_generator = to_camel
-        populate_by_name = True
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
 
 class SuccessCode(str, Enum):
    SUCCESS = '200'
@@ -120,11 +135,14 @@ class GenericResponse(CamelModel):
     customer_message: str
     code: str
     status: bool
-    debug_info: dict[str, Any] | None = None
-    info: dict[str, Any] | None = None
+    debug_info: dict[str, str] | None = None
+    info: dict[str, str] | None = None
 
     @classmethod
-    def get_error_response(cls, error_code: ErrorCode, customer_message: str, debug_info: dict[str, Any] | None = None, info: dict[str, Any] | None = None):
+    def get_error_response(cls, error_code: ErrorCode, customer_message: str, debug_info: dict[str, str] | None = None, info: dict[str, str] | None = None):
+        # Responses without debug_info/info are validated once; each caller gets its own copy.
+        if not debug_info and not info:
+            return _cached_error_response(error_code, customer_message).model_copy()
         return GenericResponse(
             error_code=error_code,
             customer_message=customer_message,
@@ -135,7 +153,7 @@ class GenericResponse(CamelModel):
         )
 
     @classmethod
-    def get_success_response(cls, customer_message: str, debug_info: dict[str, Any] | None = None, info: dict[str, Any] | None = None) -> Self:
+    def get_success_response(cls, customer_message: str, debug_info: dict[str, str] | None = None, info: dict[str, str] | None = None) -> Self:
         return cls(
             error_code=ErrorCode.ERROR_CODE_NA,
             customer_message=customer_message,
@@ -150,7 +168,21 @@ class GenericResponse(CamelModel):
         return not self.status
 
 
-class Trace(BaseModel):
+@lru_cache(maxsize=64)
+def _cached_error_response(error_code: ErrorCode, customer_message: str) -> GenericResponse:
+    return GenericResponse(
+        error_code=error_code,
+        customer_message=customer_message,
+        status=False,
+        code=''
+    )
+
+@dataclass(slots=True, frozen=True)
+class Trace:
+    """
+    Request tracing headers passed between dependencies; never serialized,
+    so it skips pydantic validation.
+    """
     request_id: str
     device_id: str
 
@@ -166,11 +198,10 @@ class TokenResponse(BaseModel):
     """
     token: str
     expires_at: str
-    
-    class Config:
-        schema_extra = {
-            "example": {
-                "token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
-                "expires_at": "2025-08-29T06:54:39Z"
-            }
-        }
\ No newline at end of file
+
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+            "expires_at": "2025-08-29T06:54:39Z"
+        }
+    })
\ No newline at end of file
@@ -1,15 +1,23 @@
 # app/services/s3_file_service.py
 
 from enum import Enum
+import asyncio
 import hashlib
+import random
 import aioboto3 # type: ignore
+from aiobotocore.config import AioConfig # type: ignore
+from boto3.s3.transfer import TransferConfig # type: ignore
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from fastapi import UploadFile
 import io
 import typing
 import aiohttp # type: ignore # Required for downloading files from URLs
-from urllib.parse import urlparse
+from urllib.parse import quote, urlparse
 import os # For os.path.basename
-from zipfile import ZipFile
+import tempfile
+from zipfile import ZipFile, ZipInfo
 from zipfile import BadZipFile
 import time
 from typing import Optional
@@ -22,15 +30,229 @@ from app.schemas import (
     InboundDocumentType,
     S3UploadFileBytesRequest
 )
-import base64
+from app.utils import DECOMPRESSION_EXECUTOR, is_safe_zip_entry
+
+# Files above the threshold are sent as concurrent multipart uploads.
+# upload_fileobj holds up to max_io_queue + max_concurrency + 1 parts in memory
+# per upload: queued parts, parts being sent and the part being read.
+# TRANSFER_CONFIG: (2 + 8 + 1) x 16 MiB = 176 MiB per large upload.
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD,
+    multipart_chunksize=MULTIPART_CHUNKSIZE,
+    max_concurrency=8,
+    max_io_queue=2
+)
+
+# Up to max_concurrency ZIP entries stream at once, so each gets smaller parts
+# and fewer part uploads: (1 + 2 + 1) x 8 MiB = 32 MiB per entry.
+ZIP_ENTRY_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=2,
+    max_io_queue=1
+)
+
+# Content types for files extracted from ZIP archives; anything else is binary.
+EXTENSION_CONTENT_TYPES = {
+    '.pdf': InboundDocumentType.PDF.value,
+    '.jpg': InboundDocumentType.IMAGE.value,
+    '.jpeg': InboundDocumentType.IMAGE.value,
+    '.png': InboundDocumentType.PNG.value,
+}
+
+# Suffix added to uploaded file names: YYYYMMDD_HHMMSS
+TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
+
+# Shared by every S3 client so requests reuse a large pool of warm connections.
+# botocore owns S3 retries (throttling, 5xx and connection errors); S3 calls
+# are not wrapped in _retry_transient as well, which would multiply attempts.
+S3_CLIENT_CONFIG = AioConfig(
+    max_pool_connections=64,
+    connect_timeout=2,
+    read_timeout=30,
+    retries={'max_attempts': 3, 'mode': 'adaptive'}
+)
+
+# Downloads share one pooled HTTP session, so connections, TLS sessions and
+# DNS lookups are reused across requests to the same CDN host.
+HTTP_CONNECTION_LIMIT = 100
+HTTP_CONNECTION_LIMIT_PER_HOST = 32
+HTTP_DNS_CACHE_TTL = 300
+HTTP_KEEPALIVE_TIMEOUT = 60
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=60)
+
+def _new_http_session() -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_CONNECTION_LIMIT,
+        limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=HTTP_TIMEOUT)
+
+# ZIP downloads are streamed in chunks into a spooled temp file that moves
+# to disk once it outgrows ZIP_SPOOL_MAX_SIZE.
+ZIP_DOWNLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+ZIP_SPOOL_MAX_SIZE = 32 * 1024 * 1024
+
+# Downloads are retried on transient failures with exponential backoff plus
+# jitter, instead of failing the whole batch. S3 calls rely on botocore's retries.
+RETRY_ATTEMPTS = 3
+
+def _is_transient_error(error: Exception) -> bool:
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status >= 500
+    return isinstance(error, (
+        asyncio.TimeoutError,
+        aiohttp.ClientConnectionError,
+        aiohttp.ClientPayloadError,
+    ))
+
+async def _retry_transient(operation: typing.Callable[[], typing.Awaitable[typing.Any]]) -> typing.Any:
+    """
+    Await operation(), retrying it on transient errors up to RETRY_ATTEMPTS times.
+    """
+    for attempt in range(RETRY_ATTEMPTS):
+        try:
+            return await operation()
+        except Exception as e:
+            if attempt == RETRY_ATTEMPTS - 1 or not _is_transient_error(e):
+                raise
+            await asyncio.sleep(2 ** attempt + random.random())
+
+async def _download_to_file(http_session: aiohttp.ClientSession, url: str, file_obj: typing.BinaryIO) -> None:
+    """
+    Download url into file_obj in ZIP_DOWNLOAD_CHUNK_SIZE chunks, replacing any
+    partial download left by a failed attempt.
+    """
+    file_obj.seek(0)
+    file_obj.truncate()
+    async with http_session.get(url) as response:
+        response.raise_for_status()
+        async for chunk in response.content.iter_chunked(ZIP_DOWNLOAD_CHUNK_SIZE):
+            file_obj.write(chunk)
+
+@lru_cache(maxsize=4096)
+def _sha256_hex(input_string: str) -> str:
+    # Memoized so a batch hashes each user's mobile number once, not once per product
+    return hashlib.sha256(input_string.encode('utf-8')).hexdigest()
+
+class _ResponseStream:
+    """
+    Minimal file-like wrapper so upload_fileobj can read an aiohttp response
+    body as it downloads, instead of buffering the whole file first.
+    """
+    def __init__(self, content: aiohttp.StreamReader):
+        self._content = content
+
+    async def read(self, size: int = -1) -> bytes:
+        return await self._content.read(size)
+
+class _ThreadedReader:
+    """
+    Wraps a blocking file object, such as an open ZIP entry, so upload_fileobj
+    reads it in a worker thread and zlib decompression stays off the event loop.
+    """
+    def __init__(self, file_obj: typing.BinaryIO):
+        self._file_obj = file_obj
+
+    async def read(self, size: int = -1) -> bytes:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(DECOMPRESSION_EXECUTOR, self._file_obj.read, size)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._file_obj.seek(offset, whence)
 
 class S3FileService:
-    def __init__(self, bucket_name: str, aws_access_key_id: str, aws_secret_access_key: str):
+    def __init__(self, bucket_name: str, aws_access_key_id: str, aws_secret_access_key: str, max_concurrency: int = 16):
         self.bucket_name = bucket_name
+        # Upper bound on the number of S3 uploads in flight per request.
+        self.max_concurrency = max_concurrency
         self.session = aioboto3.Session(
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key
         )
+        self._s3_client = None
+        self._s3_client_context = None
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        # The bucket's region never changes, so it is looked up at most once.
+        self._region: Optional[str] = None
+        self._region_resolved = False
+        self._region_lock = asyncio.Lock()
+        # Public URL prefix for the bucket, built once the region is known.
+        self._url_prefix: Optional[str] = None
+
+    async def open(self) -> None:
+        """
+        Open a long-lived S3 client and HTTP session that are shared by all
+        requests until close() is called.
+        """
+        if self._s3_client is None:
+            self._s3_client_context = self.session.client('s3', config=S3_CLIENT_CONFIG)
+            self._s3_client = await self._s3_client_context.__aenter__()
+        if self._http_session is None:
+            self._http_session = _new_http_session()
+
+    async def close(self) -> None:
+        """
+        Close the shared S3 client and HTTP session opened by open().
+        """
+        if self._s3_client_context is not None:
+            await self._s3_client_context.__aexit__(None, None, None)
+            self._s3_client = None
+            self._s3_client_context = None
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+
+    async def _get_region(self, s3_client) -> Optional[str]:
+        """
+        Return the bucket's LocationConstraint, calling get_bucket_location only once.
+        us-east-1 buckets have no LocationConstraint and return None.
+        """
+        if not self._region_resolved:
+            async with self._region_lock:
+                if not self._region_resolved:
+                    bucket_location = await s3_client.get_bucket_location(Bucket=self.bucket_name)
+                    self._region = bucket_location.get('LocationConstraint')
+                    self._region_resolved = True
+        return self._region
+
+    async def _get_url_prefix(self, s3_client) -> str:
+        """
+        Return the public URL prefix of the bucket; object URLs are {prefix}/{quoted key}.
+        """
+        if self._url_prefix is None:
+            region = await self._get_region(s3_client)
+            if region is None: # us-east-1 returns None for LocationConstraint
+                self._url_prefix = f"https://{self.bucket_name}.s3.amazonaws.com"
+            else:
+                self._url_prefix = f"https://{self.bucket_name}.s3-{region}.amazonaws.com"
+        return self._url_prefix
+
+    @asynccontextmanager
+    async def _get_s3_client(self):
+        """
+        Yield the shared S3 client, or a short-lived one if open() has not been called.
+        """
+        if self._s3_client is not None:
+            yield self._s3_client
+        else:
+            async with self.session.client('s3', config=S3_CLIENT_CONFIG) as s3_client:
+                yield s3_client
+
+    @asynccontextmanager
+    async def _get_http_session(self):
+        """
+        Yield the shared HTTP session, or a short-lived one if open() has not been called.
+        """
+        if self._http_session is not None:
+            yield self._http_session
+        else:
+            async with _new_http_session() as http_session:
+                yield http_session
 
     def _generate_key(self, directory: str, file_name: str) -> str:
         """
@@ -45,7 +267,7 @@ class S3FileService:
         """
         Generates a SHA256 hash for the given string.
         """
-        return hashlib.sha256(input_string.encode('utf-8')).hexdigest()
+        return _sha256_hex(input_string)
 
     def get_oaas_directory(self, tenant: str, user: User, product_code: str) -> str:
         """
@@ -69,18 +291,19 @@ class S3FileService:
         tenant = request.tenant
 
         base_directory = self.get_oaas_directory(tenant, user, product_data.tmp_code)
-        folder_urls: dict[str, list[str]] = {product_data.tmp_code: []}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
 
-        async with aiohttp.ClientSession() as http_session:
-            for image_item in product_data.images:
-                image_url_str = image_item.url
-                content_type_value = image_item.image_type.value
+        async def process_image(http_session: aiohttp.ClientSession, s3_client, image_item) -> list[str]:
+            """
+            Download one image (or ZIP of images) and upload it to S3.
+            Returns the S3 URLs, or error messages, for the files it produced.
+            """
+            image_urls: list[str] = []
+            image_url_str = image_item.url
+            content_type_value = image_item.image_type.value
 
+            async with semaphore:
                 try:
-                    async with http_session.get(image_url_str) as response:
-                        response.raise_for_status()
-                        content_bytes = await response.read()
-
                     parsed_url = urlparse(image_url_str)
                     file_name_from_url = os.path.basename(parsed_url.path)
 
@@ -88,49 +311,49 @@ class S3FileService:
                     # is_zip = content_type_value == 'application/zip' or content_type_value == 'application/x-zip-compressed' or file_name_from_url.lower().endswith('.zip')
                     is_zip = image_item.image_type == InboundDocumentType.ZIP
                     if is_zip:
-                        # Process ZIP file
-                        try:
-                            zip_buffer = io.BytesIO(content_bytes)
-                            with ZipFile(zip_buffer) as zip_ref:
-                                # Process each file in the ZIP
-                                for file_path in zip_ref.namelist():
-                                    if file_path.endswith('/'):  # Skip directories
-                                        continue
-                                        
-                                    try:
-                                        # Extract file content
-                                        file_content = zip_ref.read(file_path)
-                                        original_filename = os.path.basename(file_path)
-                                        
-                                        if not original_filename:
+                        with tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE) as zip_buffer:
+                            # Spool the archive so concurrent downloads are not all held in memory
+                            await _retry_transient(lambda: _download_to_file(http_session, image_url_str, zip_buffer))
+                            zip_buffer.seek(0)
+
+                            # Process ZIP file
+                            try:
+                                with ZipFile(zip_buffer) as zip_ref:
+                                    # Process each file in the ZIP
+                                    for zinfo in zip_ref.infolist():
+                                        # Skip directories and unsafe paths before anything is decompressed
+                                        if zinfo.is_dir() or not is_safe_zip_entry(zinfo.filename):
                                             continue
+                                        file_path = zinfo.filename
+
+                                        try:
+                                            original_filename = os.path.basename(file_path)
+                                        
+                                            if not original_filename:
+                                                continue
                                             
-                                        # Determine content type based on file extension
-                                        file_ext = os.path.splitext(original_filename)[1].lower()
-                                        img_content_type = {
-                                            '.pdf': InboundDocumentType.PDF.value, 
-                                            '.jpg': InboundDocumentType.IMAGE.value,
-                                            '.jpeg': InboundDocumentType.IMAGE.value,
-                                            '.png': InboundDocumentType.PNG.value,
-                                        }.get(file_ext, InboundDocumentType.BINARY.value)
+                                            # Determine content type based on file extension
+                                            file_ext = os.path.splitext(original_filename)[1].lower()
+                                            img_content_type = EXTENSION_CONTENT_TYPES.get(file_ext, InboundDocumentType.BINARY.value)
                                         
-                                        # Upload file to S3
-                                        file_stream = io.BytesIO(file_content)
-                                        s3_url = await self.save_file(
-                                            file_content_stream=file_stream,
-                                            file_name=original_filename,
-                                            directory=base_directory,
-                                            content_type_str=img_content_type
-                                        )
-                                        folder_urls[product_data.tmp_code].append(s3_url)
-                                    except Exception as e:
-                                        folder_urls[product_data.tmp_code].append(f"Error processing file {file_path} from ZIP: {str(e)}")
-                        except BadZipFile:
-                            folder_urls[product_data.tmp_code].append(f"Invalid ZIP file format: {image_url_str}")
+                                            s3_url = await self._save_zip_entry(
+                                                s3_client,
+                                                zip_ref,
+                                                zinfo,
+                                                file_name=original_filename,
+                                                directory=base_directory,
+                                                content_type_str=img_content_type
+                                            )
+                                            image_urls.append(s3_url)
+                                        except Exception as e:
+                                            image_urls.append(f"Error processing file {file_path} from ZIP: {str(e)}")
+                            except BadZipFile:
+                                image_urls.append(f"Invalid ZIP file format: {image_url_str}")
                     else:
                         # Process as a regular image file
                         if not file_name_from_url:
-                            url_hash_suffix = hashlib.sha1(image_url_str.encode()).hexdigest()[:8]
+                            # The hash only disambiguates file names, so a 4-byte digest is enough
+                            url_hash_suffix = hashlib.blake2b(image_url_str.encode(), digest_size=4).hexdigest()
                             extension = content_type_value.split('/')[-1]
                             if extension == "octet-stream":
                                 extension = "bin"
@@ -138,20 +361,32 @@ class S3FileService:
                                 extension = "jpg"
                             file_name_from_url = f"image_{url_hash_suffix}.{extension}"
 
-                        image_content_stream = io.BytesIO(content_bytes)
-                        
-                        s3_url = await self.save_file(
-                            file_content_stream=image_content_stream,
-                            file_name=file_name_from_url,
-                            directory=base_directory,
-                            content_type_str=content_type_value
-                        )
-                        folder_urls[product_data.tmp_code].append(s3_url)
+                        async def stream_to_s3() -> str:
+                            # Upload the body as it downloads; a failed download restarts both
+                            async with http_session.get(image_url_str) as response:
+                                response.raise_for_status()
+                                return await self._save_file(
+                                    s3_client,
+                                    file_content_stream=_ResponseStream(response.content),
+                                    file_name=file_name_from_url,
+                                    directory=base_directory,
+                                    content_type_str=content_type_value
+                                )
+
+                        s3_url = await _retry_transient(stream_to_s3)
+                        image_urls.append(s3_url)
                 except aiohttp.ClientError as e:
-                    folder_urls[product_data.tmp_code].append(f"Error downloading {image_url_str}: {str(e)}")
+                    image_urls.append(f"Error downloading {image_url_str}: {str(e)}")
                 except Exception as e:
-                    folder_urls[product_data.tmp_code].append(f"Error processing {image_url_str}: {str(e)}")
-        return folder_urls
+                    image_urls.append(f"Error processing {image_url_str}: {str(e)}")
+            return image_urls
+
+        async with self._get_http_session() as http_session, self._get_s3_client() as s3_client:
+            # Images are downloaded and uploaded concurrently; gather keeps request order
+            results = await asyncio.gather(
+                *(process_image(http_session, s3_client, image_item) for image_item in product_data.images)
+            )
+        return {product_data.tmp_code: [url for image_urls in results for url in image_urls]}
 
     async def save_oaas_folder(self, request: OaasFolderRequest) -> dict[str, list[str]]:
         """
@@ -165,75 +400,13 @@ class S3FileService:
         tenant = request.tenant
 
         try:
-            # Download the zip file
-            async with aiohttp.ClientSession() as http_session:
-                async with http_session.get(request.zip_folder.url) as response:
-                    response.raise_for_status()
-                    zip_content = await response.read()
-
-            # Create a BytesIO object from the zip content
-            zip_buffer = io.BytesIO(zip_content)
-
-            # Process the zip file
-            with ZipFile(zip_buffer) as zip_ref:
-                # Group files by their parent folders
-                folder_files: dict[str, list[str]] = {}
-                for file_path in zip_ref.namelist():
-                    if file_path.endswith('/'):  # Skip directories
-                        continue
-                    parent_folder = os.path.dirname(file_path).split('/')[-1]
-                    if not parent_folder:  # Skip files in root
-                        continue
-                    if parent_folder not in folder_files:
-                        folder_files[parent_folder] = []
-                    folder_files[parent_folder].append(file_path)
-
-                # Process each folder and its files
-                for folder_name, files in folder_files.items():
-                    # Initialize list for this folder's URLs
-                    folder_urls[folder_name] = []
-                    
-                    # Create S3 directory path for this folder
-                    folder_directory = self.get_oaas_directory(tenant, user, folder_name)
-
-                    # Process each file in the folder
-                    for file_path in files:
-                        try:
-                            # Extract file content
-                            file_content = zip_ref.read(file_path)
-                            original_filename = os.path.basename(file_path)
-                            name, ext = os.path.splitext(original_filename)
-                            
-                            # Generate timestamp in format: YYYYMMDD_HHMMSS
-                            timestamp = time.strftime('%Y%m%d_%H%M%S')
-                            
-                            # Combine timestamp and original filename
-                            file_name = f"{name}_{timestamp}{ext}"
-
-                            # Determine content type based on file extension
-                            file_ext = os.path.splitext(file_name)[1].lower()
-                            content_type = {
-                                '.pdf': InboundDocumentType.PDF.value, 
-                                '.jpg': InboundDocumentType.IMAGE.value,
-                                '.jpeg': InboundDocumentType.IMAGE.value,
-                                '.png': InboundDocumentType.PNG.value,
-                            }.get(file_ext, InboundDocumentType.BINARY.value)
-
-                            # Upload file to S3
-                            file_stream = io.BytesIO(file_content)
-                            s3_url = await self.save_file(
-                                file_content_stream=file_stream,
-                                file_name=file_name,
-                                directory=folder_directory,
-                                content_type_str=content_type
-                            )
-                            # Add URL to the folder's list
-                            folder_urls[folder_name].append(s3_url)
-
-                        except Exception as e:
-                            # Add error message to the folder's list
-                            folder_urls[folder_name].append(f"Error processing file {file_path}: {str(e)}")
-                            continue
+            with tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE) as zip_buffer:
+                # Download the zip file without holding the whole archive in memory
+                async with self._get_http_session() as http_session:
+                    await _retry_transient(lambda: _download_to_file(http_session, request.zip_folder.url, zip_buffer))
+                zip_buffer.seek(0)
+
+                await self._upload_zip_folders(zip_buffer, tenant, user, folder_urls)
 
             end_time = time.perf_counter()
             print(f"Time taken to process zip file: {end_time - start_time} seconds")
@@ -246,33 +419,140 @@ class S3FileService:
         except Exception as e:
             raise Exception(f"Error processing zip file: {str(e)}")
 
+    async def _upload_zip_folders(self, zip_buffer: typing.BinaryIO, tenant: str, user: User, folder_urls: dict[str, list[str]]) -> None:
+        """
+        Upload every file inside a product folder of the ZIP archive to S3,
+        streaming each entry straight from the archive to S3, with at most
+        max_concurrency uploads in flight at once.
+        Fills folder_urls with the S3 URL, or an error message, for each file.
+        """
+        with ZipFile(zip_buffer) as zip_ref:
+            # Group files by their parent folders
+            folder_files: defaultdict[str, list[ZipInfo]] = defaultdict(list)
+            for zinfo in zip_ref.infolist():
+                # Skip directories and unsafe paths before anything is decompressed
+                if zinfo.is_dir() or not is_safe_zip_entry(zinfo.filename):
+                    continue
+                parent_folder = os.path.dirname(zinfo.filename).split('/')[-1]
+                if not parent_folder:  # Skip files in root
+                    continue
+                folder_files[parent_folder].append(zinfo)
+
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            # One timestamp for the whole archive, in format: YYYYMMDD_HHMMSS
+            timestamp = time.strftime(TIMESTAMP_FORMAT)
+
+            async def upload_entry(s3_client, zinfo: ZipInfo, folder_directory: str) -> str:
+                async with semaphore:
+                    original_filename = os.path.basename(zinfo.filename)
+                    name, ext = os.path.splitext(original_filename)
+
+                    # Combine timestamp and original filename
+                    file_name = f"{name}_{timestamp}{ext}"
+
+                    # Determine content type based on file extension
+                    content_type = EXTENSION_CONTENT_TYPES.get(ext.lower(), InboundDocumentType.BINARY.value)
+
+                    return await self._save_zip_entry(
+                        s3_client,
+                        zip_ref,
+                        zinfo,
+                        file_name=file_name,
+                        directory=folder_directory,
+                        content_type_str=content_type
+                    )
+
+            # Upload the files of every folder concurrently; gather keeps the order within each folder
+            folder_directories = {
+                folder_name: self.get_oaas_directory(tenant, user, folder_name)
+                for folder_name in folder_files
+            }
+            async with self._get_s3_client() as s3_client:
+                folder_results = await asyncio.gather(*(
+                    asyncio.gather(*(
+                        upload_entry(s3_client, zinfo, folder_directories[folder_name])
+                        for zinfo in files
+                    ), return_exceptions=True)
+                    for folder_name, files in folder_files.items()
+                ))
+            for (folder_name, files), results in zip(folder_files.items(), folder_results):
+                # Report each failed file's error in place of its URL
+                folder_urls[folder_name] = [
+                    f"Error processing file {zinfo.filename}: {str(result)}" if isinstance(result, BaseException) else result
+                    for zinfo, result in zip(files, results)
+                ]
+
+    async def _save_zip_entry(self, s3_client, zip_ref: ZipFile, zinfo: ZipInfo, file_name: str, directory: str, content_type_str: typing.Optional[str] = None) -> str:
+        """
+        Upload one entry of an open ZIP archive to S3 and return its public URL.
+        Entries below MULTIPART_THRESHOLD are decompressed whole and sent with a
+        single put_object; larger ones are streamed from the archive to S3 with
+        ZIP_ENTRY_TRANSFER_CONFIG, holding at most 32 MiB of parts per entry.
+        """
+        # Each entry is read with its own decompressor, so entries can be read concurrently
+        if zinfo.file_size < MULTIPART_THRESHOLD:
+            loop = asyncio.get_running_loop()
+            file_bytes = await loop.run_in_executor(DECOMPRESSION_EXECUTOR, zip_ref.read, zinfo)
+            return await self._put_object(s3_client, file_bytes, file_name, directory, content_type_str)
+        with zip_ref.open(zinfo) as file_stream:
+            return await self._save_file(
+                s3_client,
+                file_content_stream=_ThreadedReader(file_stream),
+                file_name=file_name,
+                directory=directory,
+                content_type_str=content_type_str,
+                transfer_config=ZIP_ENTRY_TRANSFER_CONFIG
+            )
+
+    async def _put_object(self, s3_client, file_bytes: bytes, file_name: str, directory: str, content_type_str: typing.Optional[str] = None) -> str:
+        """
+        Upload an in-memory body with one put_object call, skipping the transfer manager.
+        Object settings match _save_file.
+        """
+        s3_key = self._generate_key(directory, file_name)
+        extra_args = {}
+        if content_type_str:
+            extra_args['ContentType'] = content_type_str
+
+        url_prefix = await self._get_url_prefix(s3_client)
+        await s3_client.put_object(
+            Bucket=self.bucket_name,
+            Key=s3_key,
+            Body=file_bytes,
+            **extra_args
+        )
+        return f"{url_prefix}/{quote(s3_key, safe='/')}"
+
     async def save_file(self, file_content_stream: typing.BinaryIO, file_name: str, directory: str, content_type_str: typing.Optional[str] = None) -> str:
         """
         Save the file content stream to S3 under the provided directory and return the public URL.
         Optionally sets the Content-Type of the S3 object.
         """
+        async with self._get_s3_client() as s3_client:
+            return await self._save_file(s3_client, file_content_stream, file_name, directory, content_type_str)
+
+    async def _save_file(self, s3_client, file_content_stream: typing.BinaryIO, file_name: str, directory: str, content_type_str: typing.Optional[str] = None, transfer_config: TransferConfig = TRANSFER_CONFIG) -> str:
+        """
+        save_file using an already open S3 client, so batch uploads share one client.
+        """
         s3_key = self._generate_key(directory, file_name)
         extra_args = {}
         if content_type_str:
             extra_args['ContentType'] = content_type_str
 
-        async with self.session.client('s3') as s3_client:
-            bucket_location = await s3_client.get_bucket_location(Bucket=self.bucket_name)
-            # Ensure stream is at the beginning if it's seekable (like BytesIO)
-            if hasattr(file_content_stream, 'seek') and callable(file_content_stream.seek):
-                file_content_stream.seek(0)
-            await s3_client.upload_fileobj(
-                file_content_stream, # Use the stream directly
-                self.bucket_name,
-                s3_key,
-                ExtraArgs=extra_args
-            )
-            region = bucket_location.get('LocationConstraint')
-            if region is None: # us-east-1 returns None for LocationConstraint
-                s3_url = f"https://{self.bucket_name}.s3.amazonaws.com/{s3_key}"
-            else:
-                s3_url = f"https://{self.bucket_name}.s3-{region}.amazonaws.com/{s3_key}"
-            return s3_url
+        url_prefix = await self._get_url_prefix(s3_client)
+
+        # Ensure stream is at the beginning if it's seekable (like BytesIO)
+        if hasattr(file_content_stream, 'seek') and callable(file_content_stream.seek):
+            file_content_stream.seek(0)
+        await s3_client.upload_fileobj(
+            file_content_stream, # Use the stream directly
+            self.bucket_name,
+            s3_key,
+            ExtraArgs=extra_args,
+            Config=transfer_config
+        )
+        return f"{url_prefix}/{quote(s3_key, safe='/')}"
         
 
     async def save_file_with_content_type(self, file: UploadFile, file_name: str, content_type: S3BucketContentType, directory: str) -> str:
@@ -281,18 +561,15 @@ class S3FileService:
         and return the public URL.
         """
         s3_key = self._generate_key(directory, file_name)
-        async with self.session.client('s3') as s3_client:
-            bucket_location = await s3_client.get_bucket_location(Bucket=self.bucket_name)
+        async with self._get_s3_client() as s3_client:
+            url_prefix = await self._get_url_prefix(s3_client)
             await s3_client.upload_fileobj(
                 file.file,
                 self.bucket_name,
                 s3_key,
                 ExtraArgs={'ACL': 'public-read', 'ContentType': content_type.value}
             )
-            s3_url = (
-                f"https://{self.bucket_name}.s3-{bucket_location['LocationConstraint']}.amazonaws.com/{s3_key}"
-            )
-            return s3_url
+            return f"{url_prefix}/{quote(s3_key, safe='/')}"
 
     async def save_file_with_validity(self, source: str, file_name: str, directory: str) -> str:
         """
@@ -300,8 +577,7 @@ class S3FileService:
         then return a presigned URL valid for 600 seconds.
         """
         s3_key = self._generate_key(directory, file_name)
-        async with self.session.client('s3') as s3_client:
-            bucket_location = await s3_client.get_bucket_location(Bucket=self.bucket_name)
+        async with self._get_s3_client() as s3_client:
             await s3_client.upload_file(source, self.bucket_name, s3_key)
             s3_url = await s3_client.generate_presigned_url(
                 ClientMethod='get_object',
@@ -318,53 +594,92 @@ class S3FileService:
         Save the file bytes to S3 under the provided directory and return the public URL.
         Optionally sets the Content-Type of the S3 object.
         """
+        async with self._get_s3_client() as s3_client:
+            return await self._upload_file_bytes(s3_client, file_bytes, file_name, directory, content_type_str)
+
+    async def _upload_file_bytes(self, s3_client, file_bytes: bytes, file_name: str, directory: str, content_type_str: Optional[str] = None) -> str:
+        """
+        upload_file_bytes using an already open S3 client, so batch uploads share one client.
+        """
         s3_key = self._generate_key(directory, file_name)
         extra_args = {'ACL': 'public-read'}
         if content_type_str:
             extra_args['ContentType'] = content_type_str
         
-        async with self.session.client('s3') as s3_client:
-            bucket_location = await s3_client.get_bucket_location(Bucket=self.bucket_name)
+        url_prefix = await self._get_url_prefix(s3_client)
+
+        if len(file_bytes) < MULTIPART_THRESHOLD:
+            # Small payloads go up in one request without wrapping them in a stream
+            await s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                Body=file_bytes,
+                **extra_args
+            )
+        else:
             file_stream = io.BytesIO(file_bytes)
             await s3_client.upload_fileobj(
                 file_stream,
                 self.bucket_name,
                 s3_key,
-                ExtraArgs=extra_args
+                ExtraArgs=extra_args,
+                Config=TRANSFER_CONFIG
             )
-            region = bucket_location.get('LocationConstraint')
-            if region is None:  # us-east-1 returns None for LocationConstraint
-                s3_url = f"https://{self.bucket_name}.s3.amazonaws.com/{s3_key}"
-            else:
-                s3_url = f"https://{self.bucket_name}.s3-{region}.amazonaws.com/{s3_key}"
-            return s3_url
+        return f"{url_prefix}/{quote(s3_key, safe='/')}"
     
     async def upload_product_bytes(self, request: S3UploadFileBytesRequest) -> dict[str, list[str]]:
+        """
+        Upload every image of every product in the request to S3 concurrently,
+        with at most max_concurrency uploads in flight at once.
+        Returns a dictionary mapping product codes to the S3 URLs of the images
+        that were uploaded, in request order.
+        """
         user = request.user
         tenant = request.tenant
-        result_urls: dict[str, list[str]] = {}
-        
-        for product in request.products:
-            product_code = product.product_code
-            base_directory = self.get_oaas_directory(tenant, user, product_code)
-            result_urls[product_code] = []
-            
-            timestamp = time.strftime('%Y%m%d_%H%M%S')
-            for image in product.images:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        # One slot per image so URLs keep request order regardless of which upload finishes first
+        uploaded: list[list[Optional[str]]] = [[None] * len(product.images) for product in request.products]
+
+        async def upload_image(s3_client, slots: list[Optional[str]], index: int, product_code: str, image, base_directory: str, timestamp: str) -> None:
+            async with semaphore:
                 try:
                     ext = image.image_name.split('.')[-1]
                     file_name = image.image_name.split('.')[0]
                     image_name = f"{file_name}_{timestamp}.{ext}"
-                    image_bytes = base64.b64decode(image.image_bytes)
-                    s3_url = await self.upload_file_bytes(
-                        file_bytes=image_bytes,
+                    slots[index] = await self._upload_file_bytes(
+                        s3_client,
+                        file_bytes=image.image_bytes,
                         file_name=image_name,
                         directory=base_directory,
                         content_type_str=image.image_type.value
                     )
-                    result_urls[product_code].append(s3_url)
                 except Exception as e:
                     print(f"Error uploading {image.image_name} for product {product_code}: {str(e)}")
                     # Continue with other images even if one fails
-        
-        return result_urls
+
+        timestamp = time.strftime(TIMESTAMP_FORMAT)
+        async with self._get_s3_client() as s3_client:
+            tasks = []
+            for product, slots in zip(request.products, uploaded):
+                product_code = product.product_code
+                base_directory = self.get_oaas_directory(tenant, user, product_code)
+
+                for index, image in enumerate(product.images):
+                    tasks.append(asyncio.create_task(
+                        upload_image(s3_client, slots, index, product_code, image, base_directory, timestamp)
+                    ))
+
+            try:
+                for task in asyncio.as_completed(tasks):
+                    await task
+            finally:
+                # If the request is cancelled or an upload raises, stop the rest
+                # instead of leaving them running against the client
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        return {
+            product.product_code: [url for url in slots if url is not None]
+            for product, slots in zip(request.products, uploaded)
+        }
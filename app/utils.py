@@ -1,31 +1,61 @@
 
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from zipfile import ZipFile
 from app.schemas import InboundDocumentType
 from fastapi import HTTPException
 from io import BytesIO
 from zipfile import BadZipFile
 
+# zlib releases the GIL while inflating, so ZIP decompression scales across
+# these threads without blocking the event loop.
+DECOMPRESSION_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count(),
+    thread_name_prefix="zip-decompress"
+)
+
+IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".gif", ".bmp"})
+
+# Media types that clients send for ZIP archives.
+ZIP_CONTENT_TYPES = frozenset({InboundDocumentType.ZIP.value, "application/x-zip-compressed"})
+
+def is_safe_zip_entry(filename: str) -> bool:
+    """
+    Reject absolute paths and '..' components (zip-slip) before an entry is decompressed.
+    """
+    return not filename.startswith('/') and '..' not in filename.split('/')
+
+def _read_zip_images(file_bytes: bytes) -> tuple[list[bytes], list[str]]:
+    """
+    Blocking part of extract_images: open the archive and decompress every image.
+    """
+    try:
+        with ZipFile(BytesIO(file_bytes)) as zf:
+            image_names = [
+                f for f in zf.namelist()
+                if os.path.splitext(f)[1].lower() in IMAGE_EXTENSIONS and is_safe_zip_entry(f)
+            ]
+            if not image_names:
+                raise HTTPException(
+                    status_code=400,
+                    detail="No image files found in ZIP archive"
+                )
+            images = [zf.read(name) for name in image_names]
+            return images, image_names
+    except BadZipFile:
+        raise HTTPException(status_code=400, detail="Invalid ZIP archive")
+
 async def extract_images(
     file_bytes: bytes, content_type: str
 ) -> tuple[list[bytes], list[str]]:
     """
     If zip archive, extract all image files; otherwise, return single file.
     """
-    if content_type.lower() == InboundDocumentType.ZIP:
-        try:
-            with ZipFile(BytesIO(file_bytes)) as zf:
-                image_names = [f for f in zf.namelist() if f.lower().endswith((
-                    ".png", ".jpg", ".jpeg", ".gif", ".bmp"
-                ))]
-                if not image_names:
-                    raise HTTPException(
-                        status_code=400,
-                        detail="No image files found in ZIP archive"
-                    )
-                images = [zf.read(name) for name in image_names]
-                return images, image_names
-        except BadZipFile:
-            raise HTTPException(status_code=400, detail="Invalid ZIP archive")
+    # Ignore parameters such as "; charset=binary" when matching the media type
+    if content_type.split(";", 1)[0].strip().lower() in ZIP_CONTENT_TYPES:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(DECOMPRESSION_EXECUTOR, _read_zip_images, file_bytes)
     # Non-zip: return raw bytes
     return [file_bytes], []
\ No newline at end of file
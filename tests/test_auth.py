@@ -0,0 +1,84 @@
+"""
+Test cases for the authentication dependencies.
+"""
+
+import time
+import jwt
+import pytest
+from unittest.mock import Mock
+from fastapi import HTTPException
+from app import auth
+from app.schemas import Trace
+
+
+@pytest.fixture(autouse=True)
+def clear_jwt_cache():
+    auth._jwt_cache.clear()
+    yield
+    auth._jwt_cache.clear()
+
+
+def test_cached_payload_is_returned():
+    """A cached payload is returned until its TTL elapses."""
+    payload = {"sub": "service", "exp": time.time() + 3600}
+    auth._cache_payload(b"key", payload)
+    assert auth._get_cached_payload(b"key") == payload
+
+
+def test_cache_respects_token_expiry():
+    """Tokens that are already expired are never cached."""
+    auth._cache_payload(b"key", {"sub": "service", "exp": time.time() - 1})
+    assert auth._get_cached_payload(b"key") is None
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    """The cache is bounded and evicts the oldest entry first."""
+    monkeypatch.setattr(auth, "JWT_CACHE_MAX_SIZE", 2)
+    for key in (b"a", b"b", b"c"):
+        auth._cache_payload(key, {"sub": "service"})
+    assert auth._get_cached_payload(b"a") is None
+    assert auth._get_cached_payload(b"c") is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("authorization", ["", "Token abc", "bearer abc", "Bearer not-a-jwt"])
+async def test_get_current_user_rejects_bad_authorization(authorization):
+    """Missing, non-Bearer and undecodable tokens are all rejected with 401."""
+    request = Mock(headers={})
+    with pytest.raises(HTTPException) as exc_info:
+        await auth.get_current_user(
+            request=request,
+            authorization=authorization,
+            trace=Trace(request_id="req", device_id="dev"),
+        )
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_accepts_and_caches_valid_token(monkeypatch):
+    """A valid service token is accepted and its payload cached."""
+    monkeypatch.setattr(auth, "_JWT_KEY", "test-secret")
+    monkeypatch.setattr(auth, "_JWT_ALGORITHMS", ["HS256"])
+    monkeypatch.setattr(auth, "_EXPECTED_SUB", "test-service")
+    token = jwt.encode(
+        {"sub": "test-service", "exp": int(time.time()) + 3600},
+        "test-secret",
+        algorithm="HS256"
+    )
+    trace = Trace(request_id="req", device_id="dev")
+
+    result = await auth.get_current_user(
+        request=Mock(headers={}),
+        authorization=f"Bearer {token}",
+        trace=trace,
+    )
+
+    assert result == trace
+    assert len(auth._jwt_cache) == 1
+
+
+def test_auth_error_detail_is_not_shared():
+    """Each 401 gets its own copy of the error payload."""
+    first = auth._credentials_exception()
+    first.detail["customer_message"] = "changed"
+    assert auth._credentials_exception().detail["customer_message"] == "Invalid Token"
@@ -2,11 +2,16 @@
 Test cases for the S3FileService class.
 """
 
+import asyncio
+import io
+import aiohttp
+import zipfile
 import pytest
-from unittest.mock import Mock, patch
-from app.service import S3FileService
+from unittest.mock import AsyncMock, Mock, patch
+from botocore.exceptions import ClientError
+from app.service import MULTIPART_THRESHOLD, S3FileService, ZIP_ENTRY_TRANSFER_CONFIG, _retry_transient
 from fastapi import UploadFile
-from app.schemas import OaasFolderRequest, OaasFileRequest, S3BucketContentType
+from app.schemas import OaasFolderRequest, OaasFileRequest, S3BucketContentType, S3UploadFileBytesRequest, User
 
 @pytest.fixture
 def s3_service():
@@ -135,4 +140,176 @@ async def test_error_handling(s3_service):
                 directory="test"
             )
         
-        assert "S3 upload failed" in str(exc_info.value) 
\ No newline at end of file
+        assert "S3 upload failed" in str(exc_info.value) 
+
+
+@pytest.mark.asyncio
+async def test_upload_product_bytes_concurrent(s3_service):
+    """Images are uploaded concurrently, bounded by max_concurrency, in request order."""
+    request = S3UploadFileBytesRequest(
+        user={"mobile_no": "9999999999"},
+        products=[
+            {
+                "product_code": code,
+                "images": [
+                    {"image_name": f"{code}_{i}.png", "image_type": "image/png", "image_bytes": "aGVsbG8="}
+                    for i in range(3)
+                ]
+            }
+            for code in ("p1", "p2")
+        ]
+    )
+    s3_service.max_concurrency = 2
+    in_flight = 0
+    peak = 0
+
+    async def fake_upload(s3_client, file_bytes, file_name, directory, content_type_str=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Finish later images first to check that result order is preserved
+        await asyncio.sleep(0.01 * (3 - int(file_name.split('_')[1])))
+        in_flight -= 1
+        if file_name.startswith("p2_1"):
+            raise Exception("S3 upload failed")
+        return f"https://test-bucket.s3.amazonaws.com/{directory}/{file_name}"
+
+    with patch.object(s3_service, "_upload_file_bytes", side_effect=fake_upload):
+        result = await s3_service.upload_product_bytes(request)
+
+    assert peak == 2
+    assert [url.rsplit('/', 1)[1].split('_')[1] for url in result["p1"]] == ["0", "1", "2"]
+    assert len(result["p2"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_upload_product_bytes_cancels_pending_uploads(s3_service):
+    """Cancelling the request cancels the uploads it started."""
+    request = S3UploadFileBytesRequest(
+        user={"mobile_no": "9999999999"},
+        products=[{
+            "product_code": "p1",
+            "images": [
+                {"image_name": f"p1_{i}.png", "image_type": "image/png", "image_bytes": "aGVsbG8="}
+                for i in range(3)
+            ]
+        }]
+    )
+    started = asyncio.Event()
+
+    async def hanging_upload(s3_client, file_bytes, file_name, directory, content_type_str=None):
+        started.set()
+        await asyncio.sleep(60)
+
+    with patch.object(s3_service, "_upload_file_bytes", side_effect=hanging_upload):
+        upload = asyncio.create_task(s3_service.upload_product_bytes(request))
+        await started.wait()
+        upload.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await upload
+
+    assert all(task.done() for task in asyncio.all_tasks() if task is not asyncio.current_task())
+
+
+@pytest.mark.asyncio
+async def test_upload_zip_folders_uploads_entries(s3_service):
+    """Every file inside a product folder is uploaded; small files with one put_object."""
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, "w") as zf:
+        zf.writestr("p1/", "")
+        zf.writestr("p1/a.jpg", b"jpeg bytes")
+        zf.writestr("batch/p2/b.png", b"png bytes")
+        zf.writestr("root.txt", b"skipped")
+        zf.writestr("../p3/evil.jpg", b"skipped")
+    zip_buffer.seek(0)
+    uploaded = {}
+
+    async def fake_put_object(s3_client, file_bytes, file_name, directory, content_type_str=None):
+        uploaded[file_name.split("_")[0]] = (file_bytes, content_type_str)
+        return f"https://test-bucket.s3.amazonaws.com/{directory}/{file_name}"
+
+    folder_urls: dict[str, list[str]] = {}
+    with patch.object(s3_service, "_put_object", side_effect=fake_put_object):
+        await s3_service._upload_zip_folders(zip_buffer, "tenant", User(mobile_no="9999999999"), folder_urls)
+
+    assert sorted(folder_urls) == ["p1", "p2"]
+    assert uploaded == {"a": (b"jpeg bytes", "image/jpeg"), "b": (b"png bytes", "image/png")}
+
+
+@pytest.mark.asyncio
+async def test_retry_transient_retries_download_errors():
+    """Transient download errors are retried; the first success is returned."""
+    server_error = aiohttp.ClientResponseError(Mock(), (), status=503)
+    operation = AsyncMock(side_effect=[server_error, aiohttp.ClientConnectionError(), "ok"])
+
+    with patch("app.service.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+        assert await _retry_transient(operation) == "ok"
+
+    assert operation.await_count == 3
+    assert mock_sleep.await_count == 2
+
+@pytest.mark.asyncio
+async def test_retry_transient_leaves_s3_errors_to_botocore():
+    """S3 errors, even throttling, are not retried again on top of botocore's own retries."""
+    slow_down = ClientError({"Error": {"Code": "SlowDown"}, "ResponseMetadata": {"HTTPStatusCode": 503}}, "PutObject")
+    operation = AsyncMock(side_effect=slow_down)
+
+    with pytest.raises(ClientError):
+        await _retry_transient(operation)
+
+    assert operation.await_count == 1
+
+@pytest.mark.asyncio
+async def test_get_region_is_cached(s3_service):
+    """get_bucket_location is only called once, including for us-east-1 (None)."""
+    mock_client = Mock()
+    mock_client.get_bucket_location = AsyncMock(return_value={"LocationConstraint": None})
+
+    assert await s3_service._get_region(mock_client) is None
+    assert await s3_service._get_region(mock_client) is None
+    mock_client.get_bucket_location.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_upload_file_bytes_uses_put_object_for_small_files(s3_service):
+    """Small byte payloads are sent with a single put_object call."""
+    mock_client = Mock()
+    mock_client.get_bucket_location = AsyncMock(return_value={"LocationConstraint": "ap-south-1"})
+    mock_client.put_object = AsyncMock()
+    mock_client.upload_fileobj = AsyncMock()
+
+    result = await s3_service._upload_file_bytes(mock_client, b"png bytes", "a.png", "test", "image/png")
+
+    mock_client.put_object.assert_awaited_once_with(
+        Bucket="test-bucket", Key="test/a.png", Body=b"png bytes", ACL="public-read", ContentType="image/png"
+    )
+    mock_client.upload_fileobj.assert_not_called()
+    assert result == "https://test-bucket.s3-ap-south-1.amazonaws.com/test/a.png"
+
+@pytest.mark.asyncio
+async def test_save_file_quotes_key_in_url(s3_service):
+    """Returned URLs use the cached bucket prefix and a percent-encoded key."""
+    mock_client = Mock()
+    mock_client.get_bucket_location = AsyncMock(return_value={"LocationConstraint": None})
+    mock_client.upload_fileobj = AsyncMock()
+
+    result = await s3_service._save_file(mock_client, io.BytesIO(b"data"), "my photo.jpg", "test")
+    await s3_service._save_file(mock_client, io.BytesIO(b"data"), "b.jpg", "test")
+
+    assert result == "https://test-bucket.s3.amazonaws.com/test/my%20photo.jpg"
+    mock_client.get_bucket_location.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_large_zip_entries_stream_with_small_part_queue(s3_service):
+    """Entries above the multipart threshold stream with the ZIP entry transfer config."""
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("p1/big.bin", b"\0" * MULTIPART_THRESHOLD)
+    mock_client = Mock()
+    mock_client.get_bucket_location = AsyncMock(return_value={"LocationConstraint": None})
+    mock_client.upload_fileobj = AsyncMock()
+
+    with zipfile.ZipFile(zip_buffer) as zip_ref:
+        await s3_service._save_zip_entry(mock_client, zip_ref, zip_ref.getinfo("p1/big.bin"), "big.bin", "test")
+
+    mock_client.upload_fileobj.assert_awaited_once()
+    assert mock_client.upload_fileobj.await_args.kwargs["Config"] is ZIP_ENTRY_TRANSFER_CONFIG
@@ -0,0 +1,116 @@
+"""
+Test cases for the ZIP helpers in app.utils.
+"""
+
+import io
+import threading
+import zipfile
+import pytest
+from unittest.mock import patch
+from fastapi import HTTPException
+from app import utils
+from app.utils import extract_images
+
+
+def make_zip(entries: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        for name, data in entries.items():
+            zf.writestr(name, data)
+    return buffer.getvalue()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("content_type", [
+    "application/zip",
+    "Application/ZIP",
+    "application/zip; charset=binary",
+    " application/zip ;name=photos.zip",
+    "application/x-zip-compressed",
+])
+async def test_extract_images_detects_zip_content_types(content_type):
+    """ZIP archives are recognised with parameters, any case and the x-zip-compressed alias."""
+    archive = make_zip({"a.png": b"png bytes"})
+
+    images, names = await extract_images(archive, content_type)
+
+    assert images == [b"png bytes"]
+    assert names == ["a.png"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("content_type", ["image/png", "application/octet-stream", "application/zipx"])
+async def test_extract_images_returns_other_files_unchanged(content_type):
+    """Anything that is not a ZIP archive is returned as a single file."""
+    assert await extract_images(b"raw", content_type) == ([b"raw"], [])
+
+
+@pytest.mark.asyncio
+async def test_extract_images_filters_by_extension():
+    """Only image extensions are kept, case-insensitively; other and extensionless names are skipped."""
+    archive = make_zip({
+        "a.PNG": b"a",
+        "dir/b.JpEg": b"b",
+        "c.gif": b"c",
+        "notes.txt": b"skipped",
+        "README": b"skipped",
+        "images.png/": b"",
+        "dir.jpg/file": b"skipped",
+    })
+
+    images, names = await extract_images(archive, "application/zip")
+
+    assert names == ["a.PNG", "dir/b.JpEg", "c.gif"]
+    assert images == [b"a", b"b", b"c"]
+
+
+@pytest.mark.asyncio
+async def test_extract_images_skips_unsafe_entry_names():
+    """Absolute paths and '..' components are never decompressed."""
+    archive = make_zip({
+        "ok.png": b"ok",
+        "../evil.png": b"skipped",
+        "a/../../evil.jpg": b"skipped",
+        "/abs.png": b"skipped",
+        "a..b.png": b"kept",
+    })
+
+    with patch.object(zipfile.ZipFile, "read", autospec=True, side_effect=zipfile.ZipFile.read) as mock_read:
+        images, names = await extract_images(archive, "application/zip")
+
+    assert names == ["ok.png", "a..b.png"]
+    assert images == [b"ok", b"kept"]
+    assert [call.args[1] for call in mock_read.call_args_list] == names
+
+
+@pytest.mark.asyncio
+async def test_extract_images_rejects_archives_without_images():
+    """An archive with no image entries is a 400."""
+    with pytest.raises(HTTPException) as exc_info:
+        await extract_images(make_zip({"notes.txt": b"text"}), "application/zip")
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_extract_images_rejects_invalid_archives():
+    """Bytes that are not a ZIP archive are a 400."""
+    with pytest.raises(HTTPException) as exc_info:
+        await extract_images(b"not a zip", "application/zip")
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_extract_images_decompresses_off_the_event_loop():
+    """The archive is read on the decompression thread pool, not the event loop thread."""
+    threads = []
+    read_zip_images = utils._read_zip_images
+
+    def recording_read(file_bytes):
+        threads.append(threading.current_thread())
+        return read_zip_images(file_bytes)
+
+    with patch.object(utils, "_read_zip_images", side_effect=recording_read):
+        await extract_images(make_zip({"a.png": b"a"}), "application/zip")
+
+    assert threads and threads[0] is not threading.main_thread()
+    assert threads[0].name.startswith("zip-decompress")